@@ -1,12 +1,12 @@
 from base64 import b64encode
 
-from requests.compat import builtin_str, is_py2
+import six
 
 
 def _to_native_string(string, encoding):
-    if isinstance(string, builtin_str):
+    if isinstance(string, str):
         return string
-    if is_py2:
+    if six.PY2:
         return string.encode(encoding)
     return string.decode(encoding)
 
@@ -10,9 +10,12 @@ def create(body):
     """
     Generate an image (which does not get saved on Plotly).
 
-    :param (dict) body: A mapping of body param names to values.
+    :param (dict|bytes) body: A mapping of body param names to values, or
+                              that mapping already encoded as JSON.
     :returns: (requests.Response) Returns response directly from requests.
 
     """
     url = build_url(RESOURCE)
+    if isinstance(body, bytes):
+        return request("post", url, data=body)
     return request("post", url, json=body)
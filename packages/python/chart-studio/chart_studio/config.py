@@ -6,30 +6,33 @@ This is promoted to its own module to simplify imports.
 """
 from __future__ import absolute_import
 
+import six
+
 from chart_studio import session, tools
+from chart_studio.files import CONFIG_FILE, FILE_CONTENT
+
+
+def _update_from_session(values, session_values):
+    """Override `values` with any session values that are actually set."""
+    # checking for not false, but truthy value here is the desired behavior;
+    # numbers (including False and 0) always count as set
+    values.update(
+        (key, value)
+        for key, value in session_values.items()
+        if key in values and (isinstance(value, six.integer_types) or value)
+    )
+    return values
 
 
 def get_credentials():
     """Returns the credentials that will be sent to plotly."""
-    credentials = tools.get_credentials_file()
-    session_credentials = session.get_session_credentials()
-    for credentials_key in credentials:
-
-        # checking for not false, but truthy value here is the desired behavior
-        session_value = session_credentials.get(credentials_key)
-        if session_value is False or session_value:
-            credentials[credentials_key] = session_value
-    return credentials
+    return _update_from_session(
+        tools.get_credentials_file(), session.get_session_credentials()
+    )
 
 
 def get_config():
     """Returns either module config or file config."""
-    config = tools.get_config_file()
-    session_config = session.get_session_config()
-    for config_key in config:
-
-        # checking for not false, but truthy value here is the desired behavior
-        session_value = session_config.get(config_key)
-        if session_value is False or session_value:
-            config[config_key] = session_value
-    return config
+    # Config files written before a key was added don't have it yet
+    values = dict(FILE_CONTENT[CONFIG_FILE], **tools.get_config_file())
+    return _update_from_session(values, session.get_session_config())
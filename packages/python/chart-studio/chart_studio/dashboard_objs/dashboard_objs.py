@@ -14,8 +14,6 @@ import _plotly_utils.exceptions
 from _plotly_utils import optional_imports
 from chart_studio import exceptions
 
-IPython = optional_imports.get_module("IPython")
-
 # default parameters for HTML preview
 MASTER_WIDTH = 500
 MASTER_HEIGHT = 500
@@ -359,6 +357,8 @@ class Dashboard(dict):
         they do not necessarily stay assigned to the boxes they were once
         assigned to.
         """
+        # Looked up here rather than at import since importing IPython is slow.
+        IPython = optional_imports.get_module("IPython")
         if IPython is None:
             pprint.pprint(self)
             return
@@ -23,6 +23,7 @@ FILE_CONTENT = {
         "plotly_api_domain": "https://api.plot.ly",
         "plotly_ssl_verification": True,
         "plotly_proxy_authorization": False,
+        "plotly_api_gzip_min_bytes": None,
         "world_readable": True,
         "sharing": "public",
         "auto_open": True,
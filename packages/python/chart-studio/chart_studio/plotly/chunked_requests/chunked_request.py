@@ -9,12 +9,20 @@ from six.moves.urllib.parse import urlparse, unquote
 from chart_studio.api import utils
 
 
+def _frame(data):
+    """ Return `data` (bytes or text) as one chunk-encoded frame. """
+    # Chunk sizes count bytes, not characters, so encode before measuring.
+    if not isinstance(data, bytes):
+        data = data.encode("utf-8")
+    return ("%x\r\n" % len(data)).encode("ascii") + data + b"\r\n"
+
+
 class Stream:
     def __init__(
         self,
         server,
         port=80,
-        headers={},
+        headers=None,
         url="/",
         ssl_enabled=False,
         ssl_verification_enabled=True,
@@ -23,12 +31,16 @@ class Stream:
         with chunked Transfer-Encoding to server:port with optional headers.
         """
         self.maxtries = 5
+        self.max_chunk_size = 65536
         self._tries = 0
         self._delay = 1
         self._closed = False
         self._server = server
         self._port = port
-        self._headers = headers
+        # Headers are fixed for the life of the stream, so build the full
+        # list sent on every (re)connect once.
+        self._headers = [("Transfer-Encoding", "chunked")]
+        self._headers.extend((headers or {}).items())
         self._url = url
         self._ssl_enabled = ssl_enabled
         self._ssl_verification_enabled = ssl_verification_enabled
@@ -36,11 +48,41 @@ class Stream:
 
     def write(self, data, reconnect_on=("", 200, 502)):
         """ Send `data` to the server in chunk-encoded form.
+        `data` may be bytes or text, which is sent UTF-8 encoded.
         Check the connection before writing and reconnect
         if disconnected and if the response status code is in `reconnect_on`.
 
         The response may either be an HTTPResponse object or an empty string.
         """
+        self._send(_frame(data), reconnect_on=reconnect_on)
+
+    def writelines(self, lines, reconnect_on=("", 200, 502)):
+        """ Send each item of `lines` to the server, in order.
+
+        Consecutive items are coalesced into a single chunk of up to
+        `max_chunk_size` so that a backlog of small messages costs one send
+        per chunk rather than one per message. An item larger than
+        `max_chunk_size` is sent on its own.
+        """
+        pending = []
+        pending_size = 0
+        for line in lines:
+            if not isinstance(line, bytes):
+                line = line.encode("utf-8")
+            if pending and pending_size + len(line) > self.max_chunk_size:
+                self._send(_frame(b"".join(pending)), reconnect_on=reconnect_on)
+                pending = []
+                pending_size = 0
+            pending.append(line)
+            pending_size += len(line)
+        if pending:
+            self._send(_frame(b"".join(pending)), reconnect_on=reconnect_on)
+
+    def _send(self, frame, reconnect_on=("", 200, 502)):
+        """ Send an already chunk-encoded `frame`, checking the connection
+        first as described in `write`. The frame is built once by the caller
+        so a reconnect-and-retry resends it as is.
+        """
 
         if not self._isconnected():
 
@@ -77,17 +119,13 @@ class Stream:
                 raise Exception("Attempted to write but socket " "was not connected.")
 
         try:
-            msg = data
-            msglen = format(len(msg), "x")  # msg length in hex
             # Send the message in chunk-encoded form
             self._conn.sock.setblocking(1)
-            self._conn.send(
-                "{msglen}\r\n{msg}\r\n".format(msglen=msglen, msg=msg).encode("utf-8")
-            )
+            self._conn.send(frame)
             self._conn.sock.setblocking(0)
         except http_client.socket.error:
             self._reconnect()
-            self.write(data)
+            self._send(frame)
 
     def _get_proxy_config(self):
         """
@@ -145,7 +183,6 @@ class Stream:
         """
         server = self._server
         port = self._port
-        headers = self._headers
         ssl_enabled = self._ssl_enabled
         proxy_server, proxy_port, proxy_auth = self._get_proxy_config()
 
@@ -171,15 +208,14 @@ class Stream:
                 self._conn = http_client.HTTPConnection(server, port)
 
         self._conn.putrequest("POST", self._url)
-        self._conn.putheader("Transfer-Encoding", "chunked")
-        for header in headers:
-            self._conn.putheader(header, headers[header])
+        for header, value in self._headers:
+            self._conn.putheader(header, value)
         self._conn.endheaders()
 
         # Set blocking to False prevents recv
         # from blocking while waiting for a response.
         self._conn.sock.setblocking(False)
-        self._bytes = six.b("")
+        self._bytes = b""
         self._reset_retries()
         time.sleep(0.5)
 
@@ -214,25 +250,27 @@ class Stream:
         """
         # Wait for a response
         self._conn.sock.setblocking(True)
-        # Parse the response
-        response = self._bytes
+        # Parse the response, reading as much as is available per recv
+        # rather than a byte at a time.
+        chunks = [self._bytes]
         while True:
             try:
-                _bytes = self._conn.sock.recv(1)
+                _bytes = self._conn.sock.recv(65536)
             except http_client.socket.error:
                 # For error 54: Connection reset by peer
                 # (and perhaps others)
-                return six.b("")
-            if _bytes == six.b(""):
+                return b""
+            if _bytes == b"":
                 break
             else:
-                response += _bytes
+                chunks.append(_bytes)
+        response = b"".join(chunks)
         # Set recv to be non-blocking again
         self._conn.sock.setblocking(False)
 
         # Convert the response string to a http_client.HTTPResponse
         # object with a bit of a hack
-        if response != six.b(""):
+        if response != b"":
             # Taken from
             # http://pythonwise.blogspot.ca/2010/02/parse-http-response.html
             try:
@@ -240,7 +278,7 @@ class Stream:
                 response.begin()
             except:
                 # Bad headers ... etc.
-                response = six.b("")
+                response = b""
         return response
 
     def _isconnected(self):
@@ -268,7 +306,7 @@ class Stream:
             # 3 - Check if the server has returned any data.
             # If they have, then start to store the response
             # in _bytes.
-            self._bytes = six.b("")
+            self._bytes = b""
             self._bytes = self._conn.sock.recv(1)
             return False
         except http_client.socket.error as e:
@@ -346,7 +384,7 @@ class Stream:
         self._delay = 1
 
 
-class _FakeSocket(six.StringIO):
+class _FakeSocket(six.BytesIO):
     # Used to construct a http_client.HTTPResponse object
     # from a string.
     # Thx to: http://pythonwise.blogspot.ca/2010/02/parse-http-response.html
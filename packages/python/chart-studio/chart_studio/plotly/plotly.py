@@ -17,21 +17,22 @@ and ploty's servers.
 from __future__ import absolute_import
 
 import base64
+import contextlib
 import copy
+import itertools
 import json
 import os
+import threading
 import time
 import warnings
-import webbrowser
 
 import six
-import six.moves
-import json as _json
+from six.moves.urllib.parse import urlparse
 
 import _plotly_utils.utils
 import _plotly_utils.exceptions
+from _plotly_utils.optional_imports import get_module
 from _plotly_utils.basevalidators import CompoundValidator, is_array
-from _plotly_utils.utils import PlotlyJSONEncoder
 
 from chart_studio import files, session, tools, utils, exceptions
 from chart_studio.api import v2
@@ -44,6 +45,8 @@ from chart_studio.config import get_config, get_credentials
 
 __all__ = None
 
+numpy = get_module("numpy")
+
 DEFAULT_PLOT_OPTIONS = {
     "world_readable": files.FILE_CONTENT[files.CONFIG_FILE]["world_readable"],
     "auto_open": files.FILE_CONTENT[files.CONFIG_FILE]["auto_open"],
@@ -51,6 +54,32 @@ DEFAULT_PLOT_OPTIONS = {
     "sharing": files.FILE_CONTENT[files.CONFIG_FILE]["sharing"],
 }
 
+# Keys that survive _plot_option_logic
+_PLOT_OPTION_KEYS = frozenset(DEFAULT_PLOT_OPTIONS) | {"filename"}
+
+LARGE_TRACE_WARNING_MSG = (
+    "Woah there! Look at all those points! Due to "
+    "browser limitations, the Plotly SVG drawing "
+    "functions have a hard time "
+    "graphing more than 500k data points for line "
+    "charts, or 40k points for other types of charts. "
+    "Here are some suggestions:\n"
+    "(1) Use the `plotly.graph_objs.Scattergl` "
+    "trace object to generate a WebGl graph.\n"
+    "(2) Trying using the image API to return an image "
+    "instead of a graph URL\n"
+    "(3) Use matplotlib\n"
+    "(4) See if you can create your visualization with "
+    "fewer data points\n\n"
+    "If the visualization you're using aggregates "
+    "points (e.g., box plot, histogram, etc.) you can "
+    "disregard this warning."
+)
+
+# Clock used for Stream's write buffering; monotonic where available so that
+# wall-clock adjustments can't hold writes back or flush them early.
+_clock = getattr(time, "monotonic", time.time)
+
 SHARING_ERROR_MSG = (
     "Whoops, sharing can only be set to either 'public', 'private', or " "'secret'."
 )
@@ -80,10 +109,12 @@ def _plot_option_logic(plot_options_from_args):
         4 - Update each key with plot, iplot call signature options
 
     """
-    default_plot_options = copy.deepcopy(DEFAULT_PLOT_OPTIONS)
+    # Plot option values are all strings and booleans, so shallow copies are
+    # as good as deep ones here and much cheaper.
+    default_plot_options = DEFAULT_PLOT_OPTIONS.copy()
     file_options = tools.get_config_file()
     session_options = session.get_session_plot_options()
-    plot_options_from_args = copy.deepcopy(plot_options_from_args)
+    plot_options_from_args = dict(plot_options_from_args)
 
     # Validate options and fill in defaults w world_readable and sharing
     for option_set in [plot_options_from_args, session_options, file_options]:
@@ -96,9 +127,7 @@ def _plot_option_logic(plot_options_from_args):
     user_plot_options.update(session_options)
     user_plot_options.update(plot_options_from_args)
     user_plot_options = {
-        k: v
-        for k, v in user_plot_options.items()
-        if k in default_plot_options or k == "filename"
+        k: v for k, v in user_plot_options.items() if k in _PLOT_OPTION_KEYS
     }
 
     return user_plot_options
@@ -163,7 +192,7 @@ def iplot(figure_or_data, **plot_options):
     return tools.embed(url, **embed_options)
 
 
-def plot(figure_or_data, validate=True, **plot_options):
+def plot(figure_or_data, validate=None, **plot_options):
     """Create a unique url for this plot in Plotly and optionally open url.
 
     plot_options keyword arguments:
@@ -190,40 +219,29 @@ def plot(figure_or_data, validate=True, **plot_options):
                     this plot.
     world_readable (default=True) -- Deprecated: use "sharing".
                                      Make this figure private/public
+    validate (default=True) -- Validate the figure locally before uploading.
+        Validation walks every property of the figure, so passing False (or
+        calling `update_plot_options(validate=False)` once per session) is
+        noticeably faster for large figures that are already known to be
+        valid. This also skips the warning about traces with many points.
 
     """
     import plotly.tools
+    from plotly.basedatatypes import BaseFigure
+
+    if validate is not None:
+        plot_options["validate"] = validate
+    plot_options = _plot_option_logic(plot_options)
+    validate = plot_options["validate"]
 
     figure = plotly.tools.return_figure_from_figure_or_data(figure_or_data, validate)
-    for entry in figure["data"]:
-        if ("type" in entry) and (entry["type"] == "scattergl"):
-            continue
-        for key, val in list(entry.items()):
-            try:
-                if len(val) > 40000:
-                    msg = (
-                        "Woah there! Look at all those points! Due to "
-                        "browser limitations, the Plotly SVG drawing "
-                        "functions have a hard time "
-                        "graphing more than 500k data points for line "
-                        "charts, or 40k points for other types of charts. "
-                        "Here are some suggestions:\n"
-                        "(1) Use the `plotly.graph_objs.Scattergl` "
-                        "trace object to generate a WebGl graph.\n"
-                        "(2) Trying using the image API to return an image "
-                        "instead of a graph URL\n"
-                        "(3) Use matplotlib\n"
-                        "(4) See if you can create your visualization with "
-                        "fewer data points\n\n"
-                        "If the visualization you're using aggregates "
-                        "points (e.g., box plot, histogram, etc.) you can "
-                        "disregard this warning."
-                    )
-                    warnings.warn(msg)
-            except TypeError:
-                pass
+    if validate:
+        _warn_on_large_traces(figure)
 
-    plot_options = _plot_option_logic(plot_options)
+    # Validating (or converting a Figure) already built `figure` with
+    # to_dict(), which deep copies, so the grid extraction below may strip
+    # arrays from it in place instead of copying the whole tree again.
+    owns_figure = validate or isinstance(figure_or_data, BaseFigure)
 
     # Initialize API payload
     payload = {"figure": figure, "world_readable": True}
@@ -231,9 +249,8 @@ def plot(figure_or_data, validate=True, **plot_options):
     # Process filename
     filename = plot_options.get("filename", None)
     if filename:
-        # Strip trailing slash
-        if filename[-1] == "/":
-            filename = filename[0:-1]
+        # Strip trailing slashes
+        filename = filename.rstrip("/")
 
         # split off any parent directory
         paths = filename.split("/")
@@ -262,7 +279,7 @@ def plot(figure_or_data, validate=True, **plot_options):
         raise _plotly_utils.exceptions.PlotlyError(SHARING_ERROR_MSG)
 
     # Extract grid
-    figure, grid = _extract_grid_from_fig_like(figure)
+    figure, grid = _extract_grid_from_fig_like(figure, copy_fig=not owns_figure)
 
     # Upload grid if anything was extracted
     if len(grid) > 0:
@@ -300,6 +317,21 @@ def plot(figure_or_data, validate=True, **plot_options):
     return web_url
 
 
+def _warn_on_large_traces(figure):
+    """Warn (once) if a non-WebGL trace has more than 40k points."""
+    for entry in figure["data"]:
+        if entry.get("type") == "scattergl":
+            continue
+        for val in entry.values():
+            if (
+                hasattr(val, "__len__")
+                and not isinstance(val, six.string_types)
+                and len(val) > 40000
+            ):
+                warnings.warn(LARGE_TRACE_WARNING_MSG)
+                return
+
+
 def iplot_mpl(fig, resize=True, strip_style=False, update=None, **plot_options):
     """Replot a matplotlib figure with plotly in IPython.
 
@@ -491,13 +523,18 @@ def get_figure(file_owner_or_url, file_id=None, raw=False):
                 "\nRun help on this function for more information."
                 "".format(url, plotly_rest_url)
             )
-        head = plotly_rest_url + "/~"
-        file_owner = url.replace(head, "").split("/")[0]
-        file_id = url.replace(head, "").split("/")[1]
+        # url is '<plotly_domain>/~<file_owner>/<file_id>[/...]'
+        tail = url[len(plotly_rest_url) :]
+        if tail.startswith("/~"):
+            file_owner, _, file_id = tail[len("/~") :].partition("/")
+            file_id = file_id.partition("/")[0]
+        else:
+            # No file id can be read from this url, fail the int check below
+            file_owner, file_id = None, ""
     else:
         file_owner = file_owner_or_url
     try:
-        int(file_id)
+        file_id = int(file_id)
     except ValueError:
         raise _plotly_utils.exceptions.PlotlyError(
             "The 'file_id' argument was not able to be converted into an "
@@ -505,14 +542,14 @@ def get_figure(file_owner_or_url, file_id=None, raw=False):
             "is a number that can be converted into an integer or a string "
             "that can be converted into an integer."
         )
-    if int(file_id) < 0:
+    if file_id < 0:
         raise _plotly_utils.exceptions.PlotlyError(
             "The 'file_id' argument must be a non-negative number."
         )
 
     fid = "{}:{}".format(file_owner, file_id)
     response = v2.plots.content(fid, inline_data=True)
-    figure = response.json()
+    figure = utils.from_json(response.content)
     if six.PY2:
         figure = byteify(figure)
     # Fix 'histogramx', 'histogramy', and 'bardir' stuff
@@ -557,7 +594,12 @@ def get_figure(file_owner_or_url, file_id=None, raw=False):
     return plotly.tools.get_graph_obj(figure, obj_type="Figure")
 
 
-@_plotly_utils.utils.template_doc(**tools.get_config_file())
+# The Stream docstrings are templated from the config file; read it once at
+# import rather than once per decorated object.
+_doc_config = tools.get_config_file()
+
+
+@_plotly_utils.utils.template_doc(**_doc_config)
 class Stream:
     """
     Interface to Plotly's real-time graphing API.
@@ -594,33 +636,45 @@ class Stream:
     HTTP_PORT = 80
     HTTPS_PORT = 443
 
-    @_plotly_utils.utils.template_doc(**tools.get_config_file())
-    def __init__(self, stream_id):
+    @_plotly_utils.utils.template_doc(**_doc_config)
+    def __init__(self, stream_id, buffer_size=0, max_latency=1.0):
         """
         Initialize a Stream object with your unique stream_id.
         Find your stream_id at {plotly_domain}/settings.
 
+        By default every `write` is sent right away. With a positive
+        `buffer_size`, writes are held back and sent together once at least
+        `buffer_size` bytes are waiting, or once the oldest waiting write is
+        `max_latency` seconds old (checked on each `write`). Call `flush` to
+        send them sooner; `heartbeat` and `close` flush first.
+
         For more help, see: `help(plotly.plotly.Stream)`
         or see examples and tutorials here:
         https://plot.ly/python/streaming/
 
         """
         self.stream_id = stream_id
+        self.buffer_size = buffer_size
+        self.max_latency = max_latency
         self._stream = None
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._buffer_started = None
 
     def get_streaming_specs(self):
         """
         Returns the streaming server, port, ssl_enabled flag, and headers.
 
         """
-        streaming_url = get_config()["plotly_streaming_domain"]
-        ssl_verification_enabled = get_config()["plotly_ssl_verification"]
+        config = get_config()
+        streaming_url = config["plotly_streaming_domain"]
+        ssl_verification_enabled = config["plotly_ssl_verification"]
         ssl_enabled = "https" in streaming_url
         port = self.HTTPS_PORT if ssl_enabled else self.HTTP_PORT
 
         # If no scheme (https/https) is included in the streaming_url, the
         # host will be None. Use streaming_url in this case.
-        host = six.moves.urllib.parse.urlparse(streaming_url).hostname or streaming_url
+        host = urlparse(streaming_url).hostname or streaming_url
 
         headers = {"Host": host, "plotly-streamtoken": self.stream_id}
         streaming_specs = {
@@ -642,6 +696,7 @@ class Stream:
         >>> stream.heartbeat()
 
         """
+        self.flush(reconnect_on=reconnect_on)
         try:
             self._stream.write("\n", reconnect_on=reconnect_on)
         except AttributeError:
@@ -719,7 +774,9 @@ class Stream:
         if isinstance(trace, BaseTraceType):
             stream_object = trace.to_plotly_json()
         else:
-            stream_object = copy.deepcopy(trace)
+            # Only top-level keys are modified below, so a shallow copy is
+            # enough to leave the caller's dict untouched.
+            stream_object = dict(trace)
 
         # Remove 'type' if present since this trace type cannot be changed
         stream_object.pop("type", None)
@@ -728,8 +785,19 @@ class Stream:
             stream_object.update(dict(layout=layout))
 
         # TODO: allow string version of this?
-        jdata = _json.dumps(stream_object, cls=PlotlyJSONEncoder)
-        jdata += "\n"
+        jdata = utils.to_json_bytes(stream_object) + b"\n"
+
+        if self.buffer_size > 0 and self._stream is not None:
+            if not self._buffer:
+                self._buffer_started = _clock()
+            self._buffer.append(jdata)
+            self._buffered_bytes += len(jdata)
+            if (
+                self._buffered_bytes >= self.buffer_size
+                or _clock() - self._buffer_started >= self.max_latency
+            ):
+                self.flush(reconnect_on=reconnect_on)
+            return
 
         try:
             self._stream.write(jdata, reconnect_on=reconnect_on)
@@ -740,9 +808,24 @@ class Stream:
                 "Call `open()` on the stream to open the stream."
             )
 
+    def flush(self, reconnect_on=(200, "", 408, 502)):
+        """
+        Send any writes held back by `buffer_size`, coalesced into as few
+        chunks as possible.
+
+        """
+        if not self._buffer:
+            return
+        # Keep the writes buffered until they're sent, so a failed write
+        # leaves them for the next flush to retry
+        self._stream.writelines(self._buffer, reconnect_on=reconnect_on)
+        self._buffer = []
+        self._buffered_bytes = 0
+
     def close(self):
         """
         Close the stream connection to plotly's streaming servers.
+        Buffered writes are flushed first.
 
         For more help, see: `help(plotly.plotly.Stream)`
         or see examples and tutorials here:
@@ -750,6 +833,7 @@ class Stream:
 
         """
         try:
+            self.flush()
             self._stream.close()
         except AttributeError:
             raise _plotly_utils.exceptions.PlotlyError(
@@ -764,7 +848,14 @@ class image:
     """
 
     @staticmethod
-    def get(figure_or_data, format="png", width=None, height=None, scale=None):
+    def get(
+        figure_or_data=None,
+        format="png",
+        width=None,
+        height=None,
+        scale=None,
+        figure_json=None,
+    ):
         """Return a static image of the plot described by `figure_or_data`.
 
         positional arguments:
@@ -778,6 +869,10 @@ class image:
         - scale: Increase the resolution of the image by `scale`
                  amount (e.g. `3`)
                  Only valid for PNG and JPEG images.
+        - figure_json: The figure already serialized as a JSON string (or
+                       bytes), e.g. from `fig.to_json()`. Use this instead of
+                       `figure_or_data` to send it as is, skipping local
+                       validation and re-encoding.
 
         example:
         ```
@@ -790,7 +885,14 @@ class image:
         # TODO: format is a built-in name... we shouldn't really use it
         import plotly.tools
 
-        figure = plotly.tools.return_figure_from_figure_or_data(figure_or_data, True)
+        if figure_json is None:
+            figure = plotly.tools.return_figure_from_figure_or_data(
+                figure_or_data, True
+            )
+        elif figure_or_data is not None:
+            raise _plotly_utils.exceptions.PlotlyError(
+                "Only one of `figure_or_data` or `figure_json` may be given."
+            )
 
         if format not in ["png", "svg", "jpeg", "pdf", "emf"]:
             raise _plotly_utils.exceptions.PlotlyError(
@@ -808,7 +910,7 @@ class image:
                     "Invalid scale parameter. Scale must be a number."
                 )
 
-        payload = {"figure": figure, "format": format}
+        payload = {"format": format}
         if width is not None:
             payload["width"] = width
         if height is not None:
@@ -816,6 +918,16 @@ class image:
         if scale is not None:
             payload["scale"] = scale
 
+        if figure_json is None:
+            payload["figure"] = figure
+        else:
+            # Splice the caller's JSON into the encoded payload object
+            if not isinstance(figure_json, bytes):
+                figure_json = figure_json.encode("utf-8")
+            payload = (
+                b'{"figure":' + figure_json + b"," + utils.to_json_bytes(payload)[1:]
+            )
+
         response = v2.images.create(payload)
 
         headers = response.headers
@@ -909,9 +1021,8 @@ class image:
 
         img = cls.get(figure_or_data, format, width, height, scale)
 
-        f = open(filename, "wb")
-        f.write(img)
-        f.close()
+        with open(filename, "wb") as f:
+            f.write(img)
 
 
 class file_ops:
@@ -981,13 +1092,19 @@ class grid_ops:
 
     """
 
+    # Per-thread state: the ids of the grids inside a `grid_ops.batch` block
+    # and the rows held back for each grid id, as [grid or None, rows] pairs
+    _local = threading.local()
+
     @classmethod
     def _fill_in_response_column_ids(cls, request_columns, response_columns, grid_id):
+        resp_cols_by_name = {}
+        for resp_col in response_columns:
+            resp_cols_by_name.setdefault(resp_col["name"], resp_col)
         for req_col in request_columns:
-            for resp_col in response_columns:
-                if resp_col["name"] == req_col.name:
-                    req_col.id = "{0}:{1}".format(grid_id, resp_col["uid"])
-                    response_columns.remove(resp_col)
+            resp_col = resp_cols_by_name.pop(req_col.name, None)
+            if resp_col is not None:
+                req_col.id = "{0}:{1}".format(grid_id, resp_col["uid"])
 
     @staticmethod
     def ensure_uploaded(fid):
@@ -1070,8 +1187,7 @@ class grid_ops:
 
         # Make a folder path
         if filename:
-            if filename[-1] == "/":
-                filename = filename[0:-1]
+            filename = filename.rstrip("/")
 
             paths = filename.split("/")
             parent_path = "/".join(paths[0:-1])
@@ -1145,18 +1261,18 @@ class grid_ops:
 
         grid_ops.ensure_uploaded(grid_id)
 
-        # Verify unique column names
-        column_names = [c.name for c in columns]
-        if grid:
-            existing_column_names = [c.name for c in grid]
-            column_names.extend(existing_column_names)
+        # Verify unique column names, stopping at the first duplicate
+        column_names = (c.name for c in itertools.chain(columns, grid or ()))
         duplicate_name = utils.get_first_duplicate(column_names)
         if duplicate_name:
             err = exceptions.NON_UNIQUE_COLUMN_MESSAGE.format(duplicate_name)
             raise exceptions.InputError(err)
 
+        # Rows held back for this grid must land before the new columns
+        cls._flush_grid(grid_id)
+
         # This is sorta gross, we need to double-encode this.
-        body = {"cols": _json.dumps(columns, cls=PlotlyJSONEncoder)}
+        body = {"cols": utils.to_json(columns)}
         fid = grid_id
         response = v2.grids.col_create(fid, body)
         parsed_content = response.json()
@@ -1167,7 +1283,7 @@ class grid_ops:
             grid.extend(columns)
 
     @classmethod
-    def append_rows(cls, rows, grid=None, grid_url=None):
+    def append_rows(cls, rows, grid=None, grid_url=None, batch_size=None):
         """
         Append rows to a Plotly grid.
 
@@ -1185,6 +1301,13 @@ class grid_ops:
 
         `grid_url` is a unique URL of a `grid` in your plotly account.
 
+        `batch_size` (default None) buffers rows locally instead of sending
+        them right away; they are sent in one request once at least
+        `batch_size` rows are waiting for the grid. Call `grid_ops.flush()`
+        from the same thread to send whatever is left. A local `grid` is only
+        extended once its rows have been sent. If sending fails, the rows stay
+        buffered and go out with the next flush.
+
         Usage example 1: Upload a grid to Plotly, and then append rows
         ```
         from plotly.grid_objs import Grid, Column
@@ -1210,14 +1333,26 @@ class grid_ops:
         py.grid_ops.append_rows([row], grid=grid_url)
         ```
 
+        Usage example 3: Append many rows, one request per 1000 rows
+        ```
+        for row in rows:
+            py.grid_ops.append_rows([row], grid=grid, batch_size=1000)
+        py.grid_ops.flush()
+        ```
+
         """
         grid_id = parse_grid_id_args(grid, grid_url)
 
         grid_ops.ensure_uploaded(grid_id)
 
         if grid:
-            n_columns = len([column for column in grid])
-            for row_i, row in enumerate(rows):
+            n_columns = len(grid)
+            if numpy and isinstance(rows, numpy.ndarray) and rows.ndim == 2:
+                # Every row of a 2d array has the same width; check just one.
+                rows_to_check = rows[:1]
+            else:
+                rows_to_check = rows
+            for row_i, row in enumerate(rows_to_check):
                 if len(row) != n_columns:
                     raise exceptions.InputError(
                         "The number of entries in "
@@ -1232,6 +1367,101 @@ class grid_ops:
                         )
                     )
 
+        if batch_size is None and grid_id not in cls._batched_grid_ids():
+            # Rows still buffered for this grid go out first to keep the order
+            cls._flush_grid(grid_id)
+            cls._send_rows(grid_id, rows, grid)
+            return
+
+        buffered = cls._row_buffers().setdefault(grid_id, [grid, []])
+        if grid:
+            buffered[0] = grid
+        buffered[1].extend(rows)
+        if batch_size is not None and len(buffered[1]) >= batch_size:
+            cls._flush_grid(grid_id)
+
+    @classmethod
+    @contextlib.contextmanager
+    def batch(cls, grid=None, grid_url=None):
+        """
+        Hold back `append_rows` calls for a grid and send all of their rows
+        in one request when the `with` block ends.
+
+        Only one of `grid` and `grid_url` needs to specified.
+
+        `append_columns` calls inside the block are still sent right away,
+        after any rows held back so far, so the grid sees the same sequence
+        of changes.
+
+        If the block raises, the rows held back for the grid are dropped
+        rather than sent, so a half-built batch never reaches it.
+
+        Usage example:
+        ```
+        with py.grid_ops.batch(grid=grid):
+            for row in rows:
+                py.grid_ops.append_rows([row], grid=grid)
+        ```
+
+        """
+        grid_id = parse_grid_id_args(grid, grid_url)
+        batched_grid_ids = cls._batched_grid_ids()
+        if grid_id in batched_grid_ids:
+            # Nested block for the same grid, the outer one sends the rows
+            yield
+            return
+
+        batched_grid_ids.add(grid_id)
+        try:
+            yield
+        except BaseException:
+            cls._row_buffers().pop(grid_id, None)
+            raise
+        finally:
+            batched_grid_ids.discard(grid_id)
+        cls._flush_grid(grid_id)
+
+    @classmethod
+    def _batched_grid_ids(cls):
+        if not hasattr(cls._local, "grid_ids"):
+            cls._local.grid_ids = set()
+        return cls._local.grid_ids
+
+    @classmethod
+    def _row_buffers(cls):
+        if not hasattr(cls._local, "row_buffers"):
+            cls._local.row_buffers = {}
+        return cls._local.row_buffers
+
+    @classmethod
+    def flush(cls, grid=None, grid_url=None):
+        """
+        Send rows buffered by `append_rows(..., batch_size=n)`.
+
+        With `grid` or `grid_url`, only that grid's rows are sent; with
+        neither, the rows buffered for every grid are sent. Rows are buffered
+        per thread, so only those appended from the calling thread are sent.
+
+        """
+        if grid is None and grid_url is None:
+            for grid_id in list(cls._row_buffers()):
+                cls._flush_grid(grid_id)
+        else:
+            cls._flush_grid(parse_grid_id_args(grid, grid_url))
+
+    @classmethod
+    def _flush_grid(cls, grid_id):
+        row_buffers = cls._row_buffers()
+        if grid_id in row_buffers:
+            grid, rows = row_buffers[grid_id]
+            if rows:
+                # Keep the rows buffered until they're sent, so a failed
+                # request leaves them for the next flush to retry
+                cls._send_rows(grid_id, rows, grid)
+            del row_buffers[grid_id]
+
+    @staticmethod
+    def _send_rows(grid_id, rows, grid=None):
         fid = grid_id
         v2.grids.row(fid, {"rows": rows})
 
@@ -1240,10 +1470,19 @@ class grid_ops:
 
             for column in grid:
                 n_empty_rows = longest_column_length - len(column.data)
-                empty_string_rows = ["" for _ in range(n_empty_rows)]
-                column.data.extend(empty_string_rows)
-
-            column_extensions = zip(*rows)
+                if n_empty_rows:
+                    column.data.extend(itertools.repeat("", n_empty_rows))
+
+            if (
+                numpy
+                and isinstance(rows, numpy.ndarray)
+                and rows.ndim == 2
+                and rows.dtype.kind in "biuf"
+            ):
+                # Transpose numeric arrays in numpy and hand back builtins
+                column_extensions = (col_values.tolist() for col_values in rows.T)
+            else:
+                column_extensions = zip(*rows)
             for local_column, column_extension in zip(grid, column_extensions):
                 local_column.data.extend(column_extension)
 
@@ -1380,8 +1619,14 @@ def parse_grid_id_args(grid, grid_url):
     else:
         supplied_arg_name = supplied_arg_names.pop()
         if supplied_arg_name == "grid_url":
-            path = six.moves.urllib.parse.urlparse(grid_url).path
-            file_owner, file_id = path.replace("/~", "").split("/")[0:2]
+            # Plain '<domain>/~<owner>/<id>' urls only need string splitting
+            _, sep, tail = grid_url.partition("/~")
+            parts = tail.split("/", 2)
+            if sep and len(parts) > 1 and "?" not in tail and "#" not in tail:
+                file_owner, file_id = parts[0:2]
+            else:
+                path = urlparse(grid_url).path
+                file_owner, file_id = path.replace("/~", "").split("/")[0:2]
             return "{0}:{1}".format(file_owner, file_id)
         else:
             return grid.id
@@ -1392,7 +1637,7 @@ def add_share_key_to_url(plot_url, attempt=0):
     Check that share key is enabled and update url to include the secret key
 
     """
-    urlsplit = six.moves.urllib.parse.urlparse(plot_url)
+    urlsplit = urlparse(plot_url)
     username = urlsplit.path.split("/")[1].split("~")[1]
     idlocal = urlsplit.path.split("/")[2]
     fid = "{}:{}".format(username, idlocal)
@@ -1428,7 +1673,7 @@ def get_grid(grid_url, raw=False):
     """
     fid = parse_grid_id_args(None, grid_url)
     response = v2.grids.content(fid)
-    parsed_content = response.json()
+    parsed_content = utils.from_json(response.content)
 
     if raw:
         return parsed_content
@@ -1461,12 +1706,7 @@ def _create_or_update(data, filetype):
     if filename:
         try:
             lookup_res = v2.files.lookup(filename)
-            if isinstance(lookup_res.content, bytes):
-                content = lookup_res.content.decode("utf-8")
-            else:
-                content = lookup_res.content
-
-            matching_file = json.loads(content)
+            matching_file = utils.from_json(lookup_res.content)
 
             if matching_file["filetype"] == filetype:
                 fid = matching_file["fid"]
@@ -1526,12 +1766,7 @@ def _create_or_overwrite_grid(data, max_retries=3):
     if filename:
         try:
             lookup_res = v2.files.lookup(filename)
-            if isinstance(lookup_res.content, bytes):
-                content = lookup_res.content.decode("utf-8")
-            else:
-                content = lookup_res.content
-
-            matching_file = json.loads(content)
+            matching_file = utils.from_json(lookup_res.content)
 
             fid = matching_file["fid"]
 
@@ -1640,7 +1875,7 @@ class dashboard_ops:
             world_readable = False
 
         data = {
-            "content": json.dumps(dashboard),
+            "content": utils.to_json(dashboard),
             "filename": filename,
             "world_readable": world_readable,
         }
@@ -1653,6 +1888,8 @@ class dashboard_ops:
             url = add_share_key_to_url(url)
 
         if auto_open:
+            import webbrowser
+
             webbrowser.open_new(file_info["web_url"])
 
         return url
@@ -1737,7 +1974,7 @@ class presentation_ops:
         else:
             raise _plotly_utils.exceptions.PlotlyError(SHARING_ERROR_MSG)
         data = {
-            "content": json.dumps(presentation),
+            "content": utils.to_json(presentation),
             "filename": filename,
             "world_readable": world_readable,
         }
@@ -1750,6 +1987,8 @@ class presentation_ops:
             url = add_share_key_to_url(url)
 
         if auto_open:
+            import webbrowser
+
             webbrowser.open_new(file_info["web_url"])
 
         return url
@@ -1816,7 +2055,7 @@ def _extract_grid_graph_obj(obj_dict, reference_obj, grid, path):
             #         )
 
 
-def _extract_grid_from_fig_like(fig, grid=None, path=""):
+def _extract_grid_from_fig_like(fig, grid=None, path="", copy_fig=True):
     """
     Extract inline data arrays from a figure and place them in a grid
 
@@ -1829,6 +2068,10 @@ def _extract_grid_from_fig_like(fig, grid=None, path=""):
         be constructed
     path: str (default '')
         Parent path, set to `frames` for use with frame objects
+    copy_fig: bool (default True)
+        Whether to deep copy a dict figure before removing its data arrays.
+        Pass False if the caller already owns `fig`. Ignored on recursive
+        calls, which always work on the (already copied) parent in place.
     Returns
     -------
     (dict, Grid)
@@ -1841,8 +2084,7 @@ def _extract_grid_from_fig_like(fig, grid=None, path=""):
     from plotly.graph_objs import Figure
 
     if grid is None:
-        # If not grid, this is top-level call so deep copy figure
-        copy_fig = True
+        # If not grid, this is top-level call so deep copy figure if asked
         grid = Grid([])
     else:
         # Grid passed in so this is recursive call, don't copy figure
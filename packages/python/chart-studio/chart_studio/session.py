@@ -7,12 +7,12 @@ which user they're signed in as, and plotting defaults.
 """
 from __future__ import absolute_import
 
-import copy
-
 import six
 
 import _plotly_utils.exceptions
 
+from chart_studio import utils
+
 
 _session = {"credentials": {}, "config": {}, "plot_options": {}}
 
@@ -30,6 +30,7 @@ CONFIG_KEYS = {
     "plotly_api_domain": six.string_types,
     "plotly_ssl_verification": bool,
     "plotly_proxy_authorization": bool,
+    "plotly_api_gzip_min_bytes": six.integer_types + (type(None),),
     "world_readable": bool,
     "auto_open": bool,
     "sharing": six.string_types,
@@ -64,6 +65,8 @@ def sign_in(username, api_key, **kwargs):
     :param (str|optional) plotly_api_domain:
     :param (bool|optional) plotly_ssl_verification:
     :param (bool|optional) plotly_proxy_authorization:
+    :param (int|optional) plotly_api_gzip_min_bytes: gzip-compress JSON request
+        bodies of at least this many bytes (the server must accept it)
     :param (bool|optional) world_readable:
 
     """
@@ -91,7 +94,10 @@ def sign_in(username, api_key, **kwargs):
     # add config, raise error if type is wrong.
     for key in CONFIG_KEYS:
         if key in kwargs:
-            if not isinstance(kwargs[key], CONFIG_KEYS[key]):
+            # bool is an int subclass, only accept it for boolean keys
+            if not isinstance(kwargs[key], CONFIG_KEYS[key]) or (
+                isinstance(kwargs[key], bool) and CONFIG_KEYS[key] is not bool
+            ):
                 raise _plotly_utils.exceptions.PlotlyError(
                     "{} must be of type '{}'".format(key, CONFIG_KEYS[key])
                 )
@@ -145,14 +151,14 @@ def get_session_plot_options():
     """ Returns a copy of the user supplied plot options.
     Use `update_plot_options()` to change.
     """
-    return copy.deepcopy(_session["plot_options"])
+    return utils.copy_flat_dict(_session["plot_options"])
 
 
 def get_session_config():
     """Returns either module config or file config."""
-    return copy.deepcopy(_session["config"])
+    return utils.copy_flat_dict(_session["config"])
 
 
 def get_session_credentials():
     """Returns the credentials that will be sent to plotly."""
-    return copy.deepcopy(_session["credentials"])
+    return utils.copy_flat_dict(_session["credentials"])
@@ -1,4 +1,4 @@
-from chart_studio import tools
+from chart_studio import files, tools, utils
 from chart_studio.tests.utils import PlotlyTestCase
 
 import warnings
@@ -19,6 +19,7 @@ class FileToolsTest(PlotlyTestCase):
             plotly_proxy_authorization=proxy_auth,
             world_readable=world_readable,
             auto_open=auto_open,
+            plotly_api_gzip_min_bytes=1024,
         )
         config = tools.get_config_file()
         self.assertEqual(config["plotly_domain"], domain)
@@ -29,6 +30,7 @@ class FileToolsTest(PlotlyTestCase):
         self.assertEqual(config["world_readable"], world_readable)
         self.assertEqual(config["sharing"], sharing)
         self.assertEqual(config["auto_open"], auto_open)
+        self.assertEqual(config["plotly_api_gzip_min_bytes"], 1024)
         tools.reset_config_file()
 
     def test_set_config_file_two_entries(self):
@@ -52,6 +54,13 @@ class FileToolsTest(PlotlyTestCase):
         kwargs = {"world_readable": "True"}
         self.assertRaises(TypeError, tools.set_config_file, **kwargs)
 
+    def test_set_config_file_gzip_min_bytes(self):
+
+        # Return TypeError when plotly_api_gzip_min_bytes is a bool
+
+        kwargs = {"plotly_api_gzip_min_bytes": True}
+        self.assertRaises(TypeError, tools.set_config_file, **kwargs)
+
     def test_set_config_expected_warning_msg(self):
 
         # Check that UserWarning is being called with http plotly_domain
@@ -111,3 +120,23 @@ class FileToolsTest(PlotlyTestCase):
             "proxy_password",
         ]
         self.assertTrue(all(x in reset_creds for x in expected))
+
+    def test_get_config_file_returns_copies(self):
+
+        # Cached contents must not leak mutations between calls
+
+        config = tools.get_config_file()
+        config["plotly_domain"] = "mutated"
+        self.assertNotEqual(tools.get_config_file()["plotly_domain"], "mutated")
+
+    def test_get_config_file_sees_external_writes(self):
+
+        # Writes that bypass tools must still be picked up
+
+        tools.reset_config_file()
+        config = tools.get_config_file()
+        config["plotly_domain"] = "https://written.elsewhere"
+        utils.save_json_dict(files.CONFIG_FILE, config)
+        config = tools.get_config_file()
+        self.assertEqual(config["plotly_domain"], "https://written.elsewhere")
+        tools.reset_config_file()
@@ -2,6 +2,7 @@ import json as _json
 from unittest import TestCase
 
 import _plotly_utils.utils
+from chart_studio import utils
 from chart_studio.grid_objs import Column
 from datetime import datetime as dt
 import numpy as np
@@ -37,3 +38,34 @@ class TestJSONEncoder(TestCase):
             '{"data": [1, 2, 3, null, null, null, '
             '"2014-01-05T00:00:00"], "name": "col 3"}]' == json_columns
         )
+
+    def test_to_json_matches_plotly_json_encoder(self):
+        columns = [
+            Column(numeric_list, "col 1"),
+            Column(mixed_list, "col 2"),
+            Column(np_list, "col 3"),
+            Column(np.array([1.5, np.nan, -np.inf]), "col 4"),
+        ]
+        expected = _json.dumps(
+            columns, cls=_plotly_utils.utils.PlotlyJSONEncoder, sort_keys=True
+        )
+        json_columns = utils.to_json(columns, sort_keys=True)
+        self.assertEqual(_json.loads(json_columns), _json.loads(expected))
+
+    def test_to_json_big_int_falls_back(self):
+        json_big = utils.to_json({"big": 2 ** 70})
+        self.assertEqual(json_big, '{"big": 1180591620717411303424}')
+
+    def test_to_json_bytes(self):
+        obj = {"data": [1, 2.5, np.nan, u"\u00e9"], "big": 2 ** 70}
+        json_bytes = utils.to_json_bytes(obj)
+        self.assertIsInstance(json_bytes, bytes)
+        self.assertEqual(
+            _json.loads(json_bytes.decode("utf-8")), _json.loads(utils.to_json(obj))
+        )
+
+    def test_from_json_bytes_and_text(self):
+        content = u'{"data": [1, 2.5, null, "\u00e9"]}'
+        expected = {"data": [1, 2.5, None, u"\u00e9"]}
+        self.assertEqual(utils.from_json(content.encode("utf-8")), expected)
+        self.assertEqual(utils.from_json(content), expected)
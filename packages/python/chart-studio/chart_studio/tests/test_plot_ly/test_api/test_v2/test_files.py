@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import json as _json
+
 from chart_studio.api.v2 import files
 from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
 
@@ -9,7 +11,7 @@ class FilesTest(PlotlyApiTestCase):
         super(FilesTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -41,7 +43,7 @@ class FilesTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "put")
         self.assertEqual(url, "{}/v2/files/hodor:88".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(new_filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": new_filename})
 
     def test_trash(self):
         files.trash("hodor:88")
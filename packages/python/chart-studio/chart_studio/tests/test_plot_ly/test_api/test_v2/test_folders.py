@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import json as _json
+
 from chart_studio.api.v2 import folders
 from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
 
@@ -9,7 +11,7 @@ class FoldersTest(PlotlyApiTestCase):
         super(FoldersTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -23,7 +25,7 @@ class FoldersTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/folders".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"path": "{}"}}'.format(path))
+        self.assertEqual(_json.loads(kwargs["data"]), {"path": path})
 
     def test_retrieve(self):
         folders.retrieve("hodor:88")
@@ -51,7 +53,7 @@ class FoldersTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "put")
         self.assertEqual(url, "{}/v2/folders/hodor:88".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(new_filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": new_filename})
 
     def test_trash(self):
         folders.trash("hodor:88")
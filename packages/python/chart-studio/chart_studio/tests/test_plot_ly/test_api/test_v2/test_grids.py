@@ -11,7 +11,7 @@ class GridsTest(PlotlyApiTestCase):
         super(GridsTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -25,7 +25,7 @@ class GridsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/grids".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": filename})
 
     def test_retrieve(self):
         grids.retrieve("hodor:88")
@@ -53,7 +53,7 @@ class GridsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "put")
         self.assertEqual(url, "{}/v2/grids/hodor:88".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(new_filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": new_filename})
 
     def test_trash(self):
         grids.trash("hodor:88")
@@ -119,7 +119,7 @@ class GridsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/grids/hodor:88/col".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], _json.dumps(body, sort_keys=True))
+        self.assertEqual(_json.loads(kwargs["data"]), body)
 
     def test_col_retrieve(self):
         grids.col_retrieve("hodor:88", "aaaaaa,bbbbbb")
@@ -143,7 +143,7 @@ class GridsTest(PlotlyApiTestCase):
         self.assertEqual(method, "put")
         self.assertEqual(url, "{}/v2/grids/hodor:88/col".format(self.plotly_api_domain))
         self.assertEqual(kwargs["params"], {"uid": "aaaaaa,bbbbbb"})
-        self.assertEqual(kwargs["data"], _json.dumps(body, sort_keys=True))
+        self.assertEqual(_json.loads(kwargs["data"]), body)
 
     def test_col_delete(self):
         grids.col_delete("hodor:88", "aaaaaa,bbbbbb")
@@ -162,4 +162,4 @@ class GridsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/grids/hodor:88/row".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], _json.dumps(body, sort_keys=True))
+        self.assertEqual(_json.loads(kwargs["data"]), body)
@@ -11,7 +11,7 @@ class ImagesTest(PlotlyApiTestCase):
         super(ImagesTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -34,4 +34,16 @@ class ImagesTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/images".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], _json.dumps(body, sort_keys=True))
+        self.assertEqual(_json.loads(kwargs["data"]), body)
+
+    def test_create_encoded(self):
+
+        body = b'{"figure": {"data": [{"y": [10, 10, 2, 20]}]}, "format": "png"}'
+
+        images.create(body)
+        assert self.request_mock.call_count == 1
+        args, kwargs = self.request_mock.call_args
+        method, url = args
+        self.assertEqual(method, "post")
+        self.assertEqual(url, "{}/v2/images".format(self.plotly_api_domain))
+        self.assertEqual(kwargs["data"], body)
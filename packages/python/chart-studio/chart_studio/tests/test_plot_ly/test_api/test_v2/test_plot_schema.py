@@ -9,7 +9,7 @@ class PlotSchemaTest(PlotlyApiTestCase):
         super(PlotSchemaTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import json as _json
+
 from chart_studio.api.v2 import plots
 from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
 
@@ -9,7 +11,7 @@ class PlotsTest(PlotlyApiTestCase):
         super(PlotsTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -23,7 +25,7 @@ class PlotsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "post")
         self.assertEqual(url, "{}/v2/plots".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": filename})
 
     def test_retrieve(self):
         plots.retrieve("hodor:88")
@@ -51,7 +53,7 @@ class PlotsTest(PlotlyApiTestCase):
         method, url = args
         self.assertEqual(method, "put")
         self.assertEqual(url, "{}/v2/plots/hodor:88".format(self.plotly_api_domain))
-        self.assertEqual(kwargs["data"], '{{"filename": "{}"}}'.format(new_filename))
+        self.assertEqual(_json.loads(kwargs["data"]), {"filename": new_filename})
 
     def test_trash(self):
         plots.trash("hodor:88")
@@ -1,8 +1,10 @@
 from __future__ import absolute_import
 
 import json as _json
+import zlib
 from requests.exceptions import ConnectionError
 
+import _plotly_utils.exceptions
 from plotly import version
 from chart_studio.api.utils import to_native_utf8_string
 from chart_studio.api.v2 import utils
@@ -174,13 +176,31 @@ class GetHeadersTest(PlotlyApiTestCase):
         }
         self.assertEqual(headers, expected_headers)
 
+    def test_cached_headers_follow_sign_in(self):
+        headers = utils.get_headers()
+        headers["content-type"] = "text/plain"
+        self.assertEqual(utils.get_headers()["content-type"], "application/json")
+
+        sign_in("baz", "qux")
+        headers = utils.get_headers()
+        self.assertEqual(headers["authorization"], "Basic YmF6OnF1eA==")
+
+
+class GetSessionTest(PlotlyApiTestCase):
+    def test_session_retries_only_connects(self):
+        retries = utils.get_session().get_adapter(self.plotly_api_domain).max_retries
+        self.assertEqual(retries.connect, 3)
+        self.assertFalse(retries.read)
+        self.assertEqual(retries.other, 0)
+        self.assertEqual(retries.status, 0)
+
 
 class RequestTest(PlotlyApiTestCase):
     def setUp(self):
         super(RequestTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock("requests.Session.request")
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -218,12 +238,36 @@ class RequestTest(PlotlyApiTestCase):
         utils.request(self.method, self.url, json={"foo": [Duck(), Duck()]})
         args, kwargs = self.request_mock.call_args
         method, url = args
-        expected_data = '{"foo": ["what else floats?", "what else floats?"]}'
+        expected_data = {"foo": ["what else floats?", "what else floats?"]}
         self.assertEqual(method, self.method)
         self.assertEqual(url, self.url)
-        self.assertEqual(kwargs["data"], expected_data)
+        self.assertEqual(_json.loads(kwargs["data"]), expected_data)
         self.assertNotIn("json", kwargs)
 
+    def test_request_gzip_large_json(self):
+        sign_in(self.username, self.api_key, plotly_api_gzip_min_bytes=10)
+
+        body = {"foo": list(range(100))}
+        utils.request(self.method, self.url, json=body)
+        args, kwargs = self.request_mock.call_args
+        self.assertEqual(kwargs["headers"]["content-encoding"], "gzip")
+        data = zlib.decompress(kwargs["data"], 31)
+        self.assertEqual(_json.loads(data.decode("utf-8")), body)
+
+        utils.request(self.method, self.url, json={"a": 1})
+        args, kwargs = self.request_mock.call_args
+        self.assertNotIn("content-encoding", kwargs["headers"])
+
+    def test_request_gzip_min_bytes_zero(self):
+        sign_in(self.username, self.api_key, plotly_api_gzip_min_bytes=0)
+        utils.request(self.method, self.url, json={"a": 1})
+        args, kwargs = self.request_mock.call_args
+        self.assertEqual(kwargs["headers"]["content-encoding"], "gzip")
+
+    def test_request_gzip_min_bytes_bool(self):
+        with self.assertRaises(_plotly_utils.exceptions.PlotlyError):
+            sign_in(self.username, self.api_key, plotly_api_gzip_min_bytes=True)
+
     def test_request_with_ConnectionError(self):
 
         # requests can flake out and not return a response object, we want to
@@ -15,6 +15,7 @@ from nose.plugins.attrib import attr
 import _plotly_utils.exceptions
 from chart_studio import exceptions
 from chart_studio.plotly import plotly as py
+from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
 from chart_studio.tests.utils import PlotlyTestCase
 
 
@@ -98,6 +99,30 @@ class GetFigureTest(PlotlyTestCase):
         py.get_figure("PlotlyImageTest", str(file_id), raw=True)
 
 
+class GetFigureUrlTest(PlotlyApiTestCase):
+    def setUp(self):
+        super(GetFigureUrlTest, self).setUp()
+
+        # Mock the actual api call, we don't want to do network tests here.
+        self.content_mock = self.mock("chart_studio.api.v2.plots.content")
+        self.content_mock.return_value = self.get_response(
+            b'{"data": [], "layout": {}}'
+        )
+
+    def test_url(self):
+        py.get_figure("{}/~foo/5".format(self.plotly_domain), raw=True)
+        self.content_mock.assert_called_once_with("foo:5", inline_data=True)
+
+    def test_url_with_trailing_slash(self):
+        py.get_figure("{}/~foo/5/".format(self.plotly_domain), raw=True)
+        self.content_mock.assert_called_once_with("foo:5", inline_data=True)
+
+    def test_url_without_tilde(self):
+        with self.assertRaises(_plotly_utils.exceptions.PlotlyError):
+            py.get_figure("{}/foo/5".format(self.plotly_domain))
+        self.assertEqual(self.content_mock.call_count, 0)
+
+
 class TestBytesVStrings(PlotlyTestCase):
     @skipIf(six.PY2, "Decoding and missing escapes only seen in PY3")
     def test_proper_escaping(self):
@@ -0,0 +1,220 @@
+from __future__ import absolute_import
+
+import threading
+from unittest import skipIf
+
+from plotly import optional_imports
+from chart_studio import plotly as py
+from chart_studio.exceptions import InputError, PlotlyRequestError
+from chart_studio.grid_objs import Column, Grid
+from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
+
+np = optional_imports.get_module("numpy")
+
+
+class GridOpsAppendRowsTest(PlotlyApiTestCase):
+    def setUp(self):
+        super(GridOpsAppendRowsTest, self).setUp()
+
+        # Mock the actual api call, we don't want to do network tests here.
+        self.row_mock = self.mock("chart_studio.api.v2.grids.row")
+
+        py.grid_ops._local = threading.local()
+        self.addCleanup(setattr, py.grid_ops, "_local", threading.local())
+
+        self.grid = Grid([Column([1], "first"), Column([2], "second")])
+        self.grid.id = "foo:1"
+
+    def sent_rows(self):
+        return [args[1]["rows"] for args, kwargs in self.row_mock.call_args_list]
+
+    def test_unbatched_rows_are_sent_right_away(self):
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid)
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[3, 4]]})
+        self.assertEqual(self.grid[0].data, [1, 3])
+        self.assertEqual(self.grid[1].data, [2, 4])
+
+    def test_rows_held_below_batch_size(self):
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=3)
+        py.grid_ops.append_rows([[5, 6]], grid=self.grid, batch_size=3)
+        self.assertEqual(self.row_mock.call_count, 0)
+
+        # The local grid is only extended once the rows have been sent
+        self.assertEqual(self.grid[0].data, [1])
+
+        py.grid_ops.append_rows([[7, 8]], grid=self.grid, batch_size=3)
+        self.assertEqual(self.sent_rows(), [[[3, 4], [5, 6], [7, 8]]])
+        self.assertEqual(self.grid[0].data, [1, 3, 5, 7])
+        self.assertEqual(self.grid[1].data, [2, 4, 6, 8])
+
+    def test_unbatched_call_sends_buffered_rows_first(self):
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=10)
+        py.grid_ops.append_rows([[5, 6]], grid=self.grid)
+        self.assertEqual(self.sent_rows(), [[[3, 4]], [[5, 6]]])
+        self.assertEqual(self.grid[0].data, [1, 3, 5])
+        self.assertEqual(py.grid_ops._row_buffers(), {})
+
+    def test_flush_one_grid(self):
+        grid_url = "https://plot.ly/~foo/2"
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=10)
+        py.grid_ops.append_rows([[5, 6]], grid_url=grid_url, batch_size=10)
+
+        py.grid_ops.flush(grid=self.grid)
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[3, 4]]})
+        self.assertEqual(self.grid[0].data, [1, 3])
+
+        py.grid_ops.flush(grid_url=grid_url)
+        self.row_mock.assert_called_with("foo:2", {"rows": [[5, 6]]})
+        self.assertEqual(self.row_mock.call_count, 2)
+
+    def test_flush_all_grids(self):
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=10)
+        py.grid_ops.append_rows(
+            [[5, 6]], grid_url="https://plot.ly/~foo/2", batch_size=10
+        )
+
+        py.grid_ops.flush()
+        sent = sorted(args[0] for args, kwargs in self.row_mock.call_args_list)
+        self.assertEqual(sent, ["foo:1", "foo:2"])
+
+        # Nothing is left to send
+        py.grid_ops.flush()
+        self.assertEqual(self.row_mock.call_count, 2)
+
+    def test_rows_are_buffered_per_thread(self):
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=10)
+
+        thread = threading.Thread(target=py.grid_ops.flush)
+        thread.start()
+        thread.join()
+        self.assertEqual(self.row_mock.call_count, 0)
+
+        py.grid_ops.flush()
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[3, 4]]})
+
+    def test_rows_kept_when_send_fails(self):
+        self.row_mock.side_effect = PlotlyRequestError("unavailable", 503, "")
+        py.grid_ops.append_rows([[3, 4]], grid=self.grid, batch_size=3)
+        py.grid_ops.append_rows([[5, 6]], grid=self.grid, batch_size=3)
+        with self.assertRaises(PlotlyRequestError):
+            py.grid_ops.append_rows([[7, 8]], grid=self.grid, batch_size=3)
+        self.assertEqual(self.grid[0].data, [1])
+
+        self.row_mock.side_effect = None
+        py.grid_ops.flush()
+        self.row_mock.assert_called_with("foo:1", {"rows": [[3, 4], [5, 6], [7, 8]]})
+        self.assertEqual(self.grid[0].data, [1, 3, 5, 7])
+        self.assertEqual(py.grid_ops._row_buffers(), {})
+
+
+class GridOpsBatchTest(PlotlyApiTestCase):
+    def setUp(self):
+        super(GridOpsBatchTest, self).setUp()
+
+        # Mock the actual api calls, we don't want to do network tests here.
+        self.row_mock = self.mock("chart_studio.api.v2.grids.row")
+        self.col_create_mock = self.mock("chart_studio.api.v2.grids.col_create")
+        self.col_create_mock.return_value.json.return_value = {
+            "cols": [{"name": "third", "uid": "abc"}]
+        }
+
+        py.grid_ops._local = threading.local()
+        self.addCleanup(setattr, py.grid_ops, "_local", threading.local())
+
+        self.grid = Grid([Column([1], "first"), Column([2], "second")])
+        self.grid.id = "foo:1"
+
+    def test_rows_sent_once_at_exit(self):
+        with py.grid_ops.batch(grid=self.grid):
+            py.grid_ops.append_rows([[3, 4]], grid=self.grid)
+            py.grid_ops.append_rows([[5, 6]], grid=self.grid)
+            self.assertEqual(self.row_mock.call_count, 0)
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[3, 4], [5, 6]]})
+        self.assertEqual(self.grid[0].data, [1, 3, 5])
+
+    def test_nested_batch_sent_by_outer_block(self):
+        with py.grid_ops.batch(grid=self.grid):
+            py.grid_ops.append_rows([[3, 4]], grid=self.grid)
+            with py.grid_ops.batch(grid_url="https://plot.ly/~foo/1"):
+                py.grid_ops.append_rows([[5, 6]], grid=self.grid)
+            self.assertEqual(self.row_mock.call_count, 0)
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[3, 4], [5, 6]]})
+
+    def test_append_columns_sends_held_rows_first(self):
+        calls = []
+        response = self.col_create_mock.return_value
+
+        def col_create(*args):
+            calls.append("col")
+            return response
+
+        self.row_mock.side_effect = lambda *args: calls.append("row")
+        self.col_create_mock.side_effect = col_create
+
+        with py.grid_ops.batch(grid=self.grid):
+            py.grid_ops.append_rows([[3, 4]], grid=self.grid)
+            py.grid_ops.append_columns([Column([7, 8], "third")], grid=self.grid)
+            py.grid_ops.append_rows([[5, 6, 9]], grid=self.grid)
+
+        self.assertEqual(calls, ["row", "col", "row"])
+        self.assertEqual(self.grid[2].data, [7, 8, 9])
+
+    def test_rows_dropped_when_block_raises(self):
+        with self.assertRaises(ValueError):
+            with py.grid_ops.batch(grid=self.grid):
+                py.grid_ops.append_rows([[3, 4]], grid=self.grid)
+                raise ValueError("boom")
+
+        self.assertEqual(self.row_mock.call_count, 0)
+        self.assertEqual(self.grid[0].data, [1])
+
+        # The next batch for the grid starts empty
+        with py.grid_ops.batch(grid=self.grid):
+            py.grid_ops.append_rows([[5, 6]], grid=self.grid)
+        self.row_mock.assert_called_once_with("foo:1", {"rows": [[5, 6]]})
+
+
+@skipIf(np is None, "numpy is not installed")
+class GridOpsNumpyRowsTest(PlotlyApiTestCase):
+    def setUp(self):
+        super(GridOpsNumpyRowsTest, self).setUp()
+
+        # Mock the actual api call, we don't want to do network tests here.
+        self.row_mock = self.mock("chart_studio.api.v2.grids.row")
+
+        py.grid_ops._local = threading.local()
+        self.addCleanup(setattr, py.grid_ops, "_local", threading.local())
+
+        self.grid = Grid([Column([1], "first"), Column([2], "second")])
+        self.grid.id = "foo:1"
+
+    def test_2d_array_with_grid_width(self):
+        rows = np.array([[3, 4], [5, 6]])
+        py.grid_ops.append_rows(rows, grid=self.grid)
+        self.assertEqual(self.row_mock.call_count, 1)
+
+    def test_2d_array_with_wrong_width(self):
+        rows = np.array([[3, 4, 5], [6, 7, 8]])
+        with self.assertRaises(InputError):
+            py.grid_ops.append_rows(rows, grid=self.grid)
+        self.assertEqual(self.row_mock.call_count, 0)
+
+    def test_numeric_array_extends_with_builtins(self):
+        py.grid_ops.append_rows(np.array([[3, 4.5], [5, 6.5]]), grid=self.grid)
+        self.assertEqual(self.grid[0].data, [1, 3.0, 5.0])
+        self.assertEqual(self.grid[1].data, [2, 4.5, 6.5])
+        for value in self.grid[0].data[1:] + self.grid[1].data[1:]:
+            self.assertIs(type(value), float)
+
+        py.grid_ops.append_rows(np.array([[7, 8]]), grid=self.grid)
+        self.assertEqual(self.grid[0].data[-1], 7)
+        self.assertIs(type(self.grid[0].data[-1]), int)
+
+    def test_object_and_string_arrays_extend_by_row(self):
+        py.grid_ops.append_rows(np.array([["a", "b"]]), grid=self.grid)
+        self.assertEqual(self.grid[0].data, [1, "a"])
+        self.assertIsInstance(self.grid[0].data[-1], np.str_)
+
+        py.grid_ops.append_rows(np.array([[None, "c"]], dtype=object), grid=self.grid)
+        self.assertEqual(self.grid[0].data, [1, "a", None])
+        self.assertEqual(self.grid[1].data, [2, "b", "c"])
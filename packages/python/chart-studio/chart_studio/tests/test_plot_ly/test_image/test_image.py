@@ -4,12 +4,14 @@ import imghdr
 import tempfile
 import os
 import itertools
+import json
 import warnings
 
 from nose.plugins.attrib import attr
 
 import _plotly_utils.exceptions
 from chart_studio.plotly import plotly as py
+from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
 from chart_studio.tests.utils import PlotlyTestCase
 
 
@@ -81,3 +83,38 @@ for args in itertools.product(
         test_name = test_generator.__name__.replace("_generate", "test")
         test_name += "({})".format(arg_string)
         setattr(TestImage, test_name, _test)
+
+
+class TestImageFigureJson(PlotlyApiTestCase):
+    def setUp(self):
+        super(TestImageFigureJson, self).setUp()
+
+        # Mock the actual api call, we don't want to do network tests here.
+        self.create_mock = self.mock("chart_studio.api.v2.images.create")
+        self.create_mock.return_value.headers = {"content-type": "image/png"}
+        self.create_mock.return_value.content = b"image bytes"
+
+        self.figure = {"data": [{"x": [1, 2, 3], "y": [3, 1, 6]}]}
+
+    def get_body(self):
+        args, kwargs = self.create_mock.call_args
+        return json.loads(args[0].decode("utf-8"))
+
+    def test_figure_json_text(self):
+        image = py.image.get(
+            figure_json=json.dumps(self.figure), format="png", width=300, scale=2
+        )
+        self.assertEqual(image, b"image bytes")
+        self.assertEqual(
+            self.get_body(),
+            {"figure": self.figure, "format": "png", "width": 300, "scale": 2.0},
+        )
+
+    def test_figure_json_bytes(self):
+        py.image.get(figure_json=json.dumps(self.figure).encode("utf-8"))
+        self.assertEqual(self.get_body(), {"figure": self.figure, "format": "png"})
+
+    def test_figure_json_and_figure_or_data(self):
+        with self.assertRaises(_plotly_utils.exceptions.PlotlyError):
+            py.image.get(self.figure, figure_json=json.dumps(self.figure))
+        self.assertEqual(self.create_mock.call_count, 0)
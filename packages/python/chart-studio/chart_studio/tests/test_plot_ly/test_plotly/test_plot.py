@@ -272,6 +272,53 @@ class TestPlotOptionLogic(PlotlyTestCase):
         for key in new_options:
             self.assertEqual(new_options[key], options[key])
 
+    def mock_create_or_update(self):
+        patcher = patch("chart_studio.plotly.plotly._create_or_update")
+        create_or_update_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        create_or_update_mock.return_value = {"web_url": "https://plot.ly/~foo/1/"}
+        return create_or_update_mock
+
+    def test_update_plot_options_disables_validation(self):
+        create_or_update_mock = self.mock_create_or_update()
+        fig = {"data": [{"type": "scatter", "bogus": 1}]}
+        with self.assertRaises(ValueError):
+            py.plot(fig, auto_open=False)
+
+        py.update_plot_options(validate=False)
+        py.plot(fig, auto_open=False)
+        payload, file_type = create_or_update_mock.call_args[0]
+        self.assertEqual(payload["figure"]["data"][0]["bogus"], 1)
+
+    def test_validate_argument_overrides_plot_options(self):
+        self.mock_create_or_update()
+        fig = {"data": [{"type": "scatter", "bogus": 1}]}
+        py.plot(fig, validate=False, auto_open=False)
+
+        py.update_plot_options(validate=False)
+        with self.assertRaises(ValueError):
+            py.plot(fig, validate=True, auto_open=False)
+
+    def test_large_trace_warning_only_when_validating(self):
+        self.mock_create_or_update()
+
+        # Keep the large array out of a grid upload
+        for name in ("grid_ops.upload", "_set_grid_column_references"):
+            patcher = patch("chart_studio.plotly.plotly." + name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        fig = {"data": [{"type": "scatter", "y": list(range(40001))}]}
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            py.plot(fig, validate=False, auto_open=False)
+        self.assertNotIn(py.LARGE_TRACE_WARNING_MSG, [str(x.message) for x in w])
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            py.plot(fig, validate=True, auto_open=False)
+        self.assertIn(py.LARGE_TRACE_WARNING_MSG, [str(x.message) for x in w])
+
 
 def generate_conflicting_plot_options_in_signin():
     """sign_in overrides the default plot options.
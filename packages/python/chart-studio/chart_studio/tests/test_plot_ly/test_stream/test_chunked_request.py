@@ -0,0 +1,66 @@
+from __future__ import absolute_import
+
+from unittest import TestCase
+
+from six.moves import http_client
+
+from chart_studio.plotly.chunked_requests import chunked_request
+
+
+class FrameTest(TestCase):
+    def test_text_is_utf8_encoded(self):
+        # The chunk size counts encoded bytes, not characters
+        self.assertEqual(chunked_request._frame(u"\u00e9\n"), b"3\r\n\xc3\xa9\n\r\n")
+
+    def test_bytes_sent_as_is(self):
+        self.assertEqual(chunked_request._frame(b'{"x":1}\n'), b'8\r\n{"x":1}\n\r\n')
+
+    def test_size_is_hex(self):
+        self.assertEqual(chunked_request._frame(b"a" * 26)[:4], b"1a\r\n")
+
+
+class WritelinesTest(TestCase):
+    def setUp(self):
+        # Skip __init__, it connects to the server
+        self.stream = chunked_request.Stream.__new__(chunked_request.Stream)
+        self.stream.max_chunk_size = 10
+        self.sent = []
+        self.stream._send = lambda frame, reconnect_on: self.sent.append(frame)
+
+    def test_lines_up_to_max_chunk_size_share_a_chunk(self):
+        self.stream.writelines([b"aaaa", b"bbbbbb", b"c"])
+        self.assertEqual(self.sent, [b"a\r\naaaabbbbbb\r\n", b"1\r\nc\r\n"])
+
+    def test_oversized_line_sent_alone(self):
+        self.stream.writelines([b"a", b"b" * 12, b"c"])
+        self.assertEqual(
+            self.sent, [b"1\r\na\r\n", b"c\r\n" + b"b" * 12 + b"\r\n", b"1\r\nc\r\n"]
+        )
+
+    def test_order_is_kept(self):
+        lines = [u"{}\n".format(i) for i in range(10)]
+        self.stream.writelines(lines)
+        self.assertEqual(len(self.sent), 2)
+        payload = b"".join(frame.split(b"\r\n")[1] for frame in self.sent)
+        self.assertEqual(payload, "".join(lines).encode("utf-8"))
+
+    def test_no_lines_no_send(self):
+        self.stream.writelines([])
+        self.assertEqual(self.sent, [])
+
+
+class FakeSocketTest(TestCase):
+    def test_parse_response(self):
+        raw = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain\r\n"
+            b"Content-Length: 2\r\n"
+            b"\r\n"
+            b"ok"
+        )
+        response = http_client.HTTPResponse(chunked_request._FakeSocket(raw))
+        response.begin()
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.reason, "OK")
+        self.assertEqual(response.getheader("Content-Type"), "text/plain")
+        self.assertEqual(response.read(), b"ok")
@@ -0,0 +1,101 @@
+from __future__ import absolute_import
+
+import sys
+from unittest import TestCase
+
+from chart_studio.plotly import plotly as py
+
+# import from mock
+if sys.version_info >= (3, 3):
+    from unittest.mock import MagicMock, patch
+else:
+    from mock import MagicMock, patch
+
+
+class StreamBufferTest(TestCase):
+    def setUp(self):
+        patcher = patch("chart_studio.plotly.plotly._clock")
+        self.clock_mock = patcher.start()
+        self.clock_mock.return_value = 0.0
+        self.addCleanup(patcher.stop)
+
+    def get_stream(self, **kwargs):
+        stream = py.Stream("abc", **kwargs)
+        stream._stream = MagicMock()
+        return stream
+
+    def test_unbuffered_write_per_call(self):
+        stream = self.get_stream()
+        stream.write({"x": 1})
+        stream.write({"x": 2})
+        self.assertEqual(stream._stream.write.call_count, 2)
+        self.assertEqual(stream._stream.writelines.call_count, 0)
+        args, kwargs = stream._stream.write.call_args
+        self.assertEqual(args, (b'{"x":2}\n',))
+
+    def test_nothing_sent_below_buffer_size(self):
+        stream = self.get_stream(buffer_size=100)
+        stream.write({"x": 1})
+        stream.write({"x": 2})
+        self.assertEqual(stream._stream.write.call_count, 0)
+        self.assertEqual(stream._stream.writelines.call_count, 0)
+
+    def test_flush_when_buffer_size_reached(self):
+        # Each write is 8 bytes: '{"x":1}\n'
+        stream = self.get_stream(buffer_size=16)
+        stream.write({"x": 1})
+        self.assertEqual(stream._stream.writelines.call_count, 0)
+        stream.write({"x": 2})
+        args, kwargs = stream._stream.writelines.call_args
+        self.assertEqual(args, ([b'{"x":1}\n', b'{"x":2}\n'],))
+
+        # The buffer starts over after a flush
+        stream.write({"x": 3})
+        self.assertEqual(stream._stream.writelines.call_count, 1)
+        self.assertEqual(stream._stream.write.call_count, 0)
+
+    def test_flush_after_max_latency(self):
+        stream = self.get_stream(buffer_size=1000, max_latency=0.5)
+        stream.write({"x": 1})
+        self.clock_mock.return_value = 0.4
+        stream.write({"x": 2})
+        self.assertEqual(stream._stream.writelines.call_count, 0)
+
+        self.clock_mock.return_value = 0.5
+        stream.write({"x": 3})
+        args, kwargs = stream._stream.writelines.call_args
+        self.assertEqual(args, ([b'{"x":1}\n', b'{"x":2}\n', b'{"x":3}\n'],))
+
+    def test_heartbeat_flushes_first(self):
+        stream = self.get_stream(buffer_size=1000)
+        stream.write({"x": 1})
+        stream.heartbeat()
+        self.assertEqual(
+            [call[0] for call in stream._stream.method_calls], ["writelines", "write"]
+        )
+        args, kwargs = stream._stream.write.call_args
+        self.assertEqual(args, ("\n",))
+
+    def test_close_flushes_first(self):
+        stream = self.get_stream(buffer_size=1000)
+        stream.write({"x": 1})
+        stream.close()
+        self.assertEqual(
+            [call[0] for call in stream._stream.method_calls], ["writelines", "close"]
+        )
+        args, kwargs = stream._stream.writelines.call_args
+        self.assertEqual(args, ([b'{"x":1}\n'],))
+
+    def test_failed_flush_keeps_buffer(self):
+        stream = self.get_stream(buffer_size=1000)
+        stream._stream.writelines.side_effect = ValueError("status code 500")
+        stream.write({"x": 1})
+        with self.assertRaises(ValueError):
+            stream.flush()
+
+        stream._stream.writelines.side_effect = None
+        stream.write({"x": 2})
+        stream.flush()
+        args, kwargs = stream._stream.writelines.call_args
+        self.assertEqual(args, ([b'{"x":1}\n', b'{"x":2}\n'],))
+        self.assertEqual(stream._buffer, [])
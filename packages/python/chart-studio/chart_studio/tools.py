@@ -9,6 +9,7 @@ Functions that USERS will possibly want access to.
 """
 from __future__ import absolute_import
 
+import os
 import warnings
 
 import six
@@ -21,11 +22,37 @@ from _plotly_utils.files import ensure_writable_plotly_dir
 from chart_studio import session, utils
 from chart_studio.files import CONFIG_FILE, CREDENTIALS_FILE, FILE_CONTENT
 
-ipython_core_display = optional_imports.get_module("IPython.core.display")
-ipython_display = optional_imports.get_module("IPython.display")
-
 sage_salvus = optional_imports.get_module("sage_salvus")
 
+# Parsed contents of the credentials and config files, keyed by filename.
+# Each entry also holds the (mtime, size) of the file when it was read so that
+# edits made outside of this process are still picked up.
+_file_cache = {}
+
+
+def _load_json_file(filename, *args):
+    """Like `utils.load_json_dict`, but only re-reads the file if it changed."""
+    try:
+        stat = os.stat(filename)
+        signature = (stat.st_mtime, stat.st_size)
+    except OSError:
+        signature = None
+
+    cached = _file_cache.get(filename)
+    if cached is None or cached[0] != signature:
+        cached = (signature, utils.load_json_dict(filename))
+        _file_cache[filename] = cached
+
+    contents = cached[1]
+    if args:
+        contents = {key: contents[key] for key in args if key in contents}
+    return utils.copy_flat_dict(contents)
+
+
+def invalidate_config_cache():
+    """Forget cached file contents so the next read comes from disk."""
+    _file_cache.clear()
+
 
 def get_config_defaults():
     """
@@ -65,6 +92,9 @@ def ensure_local_plotly_files():
             if contents_orig.keys() != contents.keys():
                 utils.save_json_dict(fn, contents)
 
+        # Every function here that writes these files finishes by calling us.
+        invalidate_config_cache()
+
     else:
         warnings.warn(
             "Looks like you don't have 'read-write' permission to "
@@ -126,7 +156,7 @@ def get_credentials_file(*args):
 
     """
     # Read credentials from file if possible
-    credentials = utils.load_json_dict(CREDENTIALS_FILE, *args)
+    credentials = _load_json_file(CREDENTIALS_FILE, *args)
     if not credentials:
         # Credentials could not be read, use defaults
         credentials = copy.copy(FILE_CONTENT[CREDENTIALS_FILE])
@@ -152,6 +182,7 @@ def set_config_file(
     world_readable=None,
     sharing=None,
     auto_open=None,
+    plotly_api_gzip_min_bytes=None,
 ):
     """Set the keyword-value pairs in `~/.plotly/.config`.
 
@@ -161,6 +192,9 @@ def set_config_file(
     :param (bool) plotly_ssl_verification: True = verify, False = don't verify
     :param (bool) plotly_proxy_authorization: True = use plotly proxy auth creds
     :param (bool) world_readable: True = public, False = private
+    :param (int) plotly_api_gzip_min_bytes: gzip-compress JSON request bodies
+        of at least this many bytes; only for a server that accepts
+        `Content-Encoding: gzip` (default None = never compress)
 
     """
     if not ensure_writable_plotly_dir():
@@ -197,6 +231,13 @@ def set_config_file(
         settings["auto_open"] = auto_open
     elif auto_open is not None:
         raise TypeError("auto_open should be a boolean")
+    # bool is an int subclass, but True would mean "compress everything"
+    if isinstance(plotly_api_gzip_min_bytes, bool):
+        raise TypeError("plotly_api_gzip_min_bytes should be an integer")
+    elif isinstance(plotly_api_gzip_min_bytes, six.integer_types):
+        settings["plotly_api_gzip_min_bytes"] = plotly_api_gzip_min_bytes
+    elif plotly_api_gzip_min_bytes is not None:
+        raise TypeError("plotly_api_gzip_min_bytes should be an integer")
 
     # validate plotly_domain and plotly_api_domain
     utils.validate_plotly_domains(
@@ -228,7 +269,7 @@ def get_config_file(*args):
 
     """
     # Read config from file if possible
-    config = utils.load_json_dict(CONFIG_FILE, *args)
+    config = _load_json_file(CONFIG_FILE, *args)
     if not config:
         # Config could not be read, use defaults
         config = copy.copy(FILE_CONTENT[CONFIG_FILE])
@@ -359,6 +400,9 @@ def embed(file_owner_or_url, file_id=None, width="100%", height=525):
                               figure
 
     """
+    # Looked up here rather than at import since importing IPython is slow.
+    ipython_core_display = optional_imports.get_module("IPython.core.display")
+    ipython_display = optional_imports.get_module("IPython.display")
     try:
         s = get_embed(file_owner_or_url, file_id=file_id, width=width, height=height)
 
@@ -16,11 +16,11 @@ import json as _json
 
 from _plotly_utils.exceptions import PlotlyError
 from _plotly_utils.optional_imports import get_module
+from _plotly_utils.utils import PlotlyJSONEncoder
 
 # Optional imports, may be None for users that only use our core functionality.
 numpy = get_module("numpy")
-pandas = get_module("pandas")
-sage_all = get_module("sage.all")
+orjson = get_module("orjson")
 
 
 ### incase people are using threading, we lock file reads
@@ -101,6 +101,17 @@ def ensure_dir_exists(directory):
             os.makedirs(directory)
 
 
+def copy_flat_dict(d):
+    """
+    Copy a dict of immutables and lists, e.g., `stream_ids` in credentials.
+
+    Config, credentials and session dicts are read on every api call, this is
+    much cheaper than `copy.deepcopy` for them.
+
+    """
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in d.items()}
+
+
 def get_first_duplicate(items):
     seen = set()
     for item in items:
@@ -111,6 +122,84 @@ def get_first_duplicate(items):
     return None
 
 
+### json encoding
+
+# orjson only knows about builtins, datetimes and numpy. Everything else (our
+# own objects, pandas, sage, PIL, ...) is handed back to PlotlyJSONEncoder.
+_plotly_json_default = PlotlyJSONEncoder().default
+
+
+def _orjson_dumps(obj, sort_keys):
+    # Return orjson's UTF-8 bytes, or None if orjson is missing or refuses
+    # `obj`, e.g., for integers that don't fit in 64 bits.
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_plotly_json_default, option=option)
+        except TypeError:
+            pass
+    return None
+
+
+def _stdlib_dumps(obj, sort_keys):
+    # Payloads of plain builtins without NaN/Inf (folder paths, metadata,
+    # rows of numbers, ...) encode the same with the stdlib's C encoder as
+    # with PlotlyJSONEncoder, which inspects every node in Python and then
+    # re-encodes the result. Only fall back on it when the fast path fails.
+    try:
+        return _json.dumps(obj, sort_keys=sort_keys, allow_nan=False)
+    except (TypeError, ValueError):
+        return _json.dumps(obj, sort_keys=sort_keys, cls=PlotlyJSONEncoder)
+
+
+def to_json(obj, sort_keys=False):
+    """
+    Encode `obj` as a strict JSON string (NaN and Inf become null).
+
+    orjson is used when it's installed since it's considerably faster than
+    PlotlyJSONEncoder on large figures and serializes numpy arrays natively.
+    Without orjson (or if it refuses `obj`, e.g., for integers that don't fit
+    in 64 bits) the stdlib encoder is tried first and PlotlyJSONEncoder is
+    only used for payloads that need it.
+
+    """
+    encoded = _orjson_dumps(obj, sort_keys)
+    if encoded is not None:
+        return encoded.decode("utf-8")
+    return _stdlib_dumps(obj, sort_keys)
+
+
+def to_json_bytes(obj, sort_keys=False):
+    """
+    Like `to_json`, but return UTF-8 encoded bytes.
+
+    Use this when the result goes straight onto the wire (request bodies,
+    stream writes); orjson already produces bytes, so no text copy is made.
+
+    """
+    encoded = _orjson_dumps(obj, sort_keys)
+    if encoded is not None:
+        return encoded
+    return _stdlib_dumps(obj, sort_keys).encode("utf-8")
+
+
+def from_json(content):
+    """
+    Decode a JSON document given as bytes (e.g., a response body) or text.
+
+    orjson parses bytes directly, which avoids making a decoded text copy of
+    large figures and grids before parsing them.
+
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return _json.loads(content)
+
+
 ### source key
 def is_source_key(key):
     src_regex = re.compile(r".+src$")